@@ -10,11 +10,45 @@ Modules:
     exceptions (LibraryException): Custom exceptions for library-related errors.
     storage (LibraryStorage): Manages storage operations within the library.
     library (Library): Main class that ties together library functionality.
+    analytics (CirculationStats): Running circulation statistics and popularity reports.
+
+Public names are resolved lazily on first attribute access, so ``import library`` stays cheap and
+submodules (and their dependencies such as ``json``) are only imported when actually used.
 
 """
 
-from .book import Book
-from .user import User
-from .exceptions import LibraryException, BookNotAvailableException, UserNotRegisteredException
-from .storage import LibraryStorage
-from .library import Library
+from importlib import import_module
+from typing import Any
+from typing import List
+
+_LAZY_ATTRIBUTES = {
+    "Book": ".book",
+    "User": ".user",
+    "LibraryException": ".exceptions",
+    "BookNotAvailableException": ".exceptions",
+    "UserNotRegisteredException": ".exceptions",
+    "LibraryStorage": ".storage",
+    "Library": ".library",
+    "CirculationStats": ".analytics",
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Imports the submodule providing ``name`` on first access and caches the attribute on the package.
+
+    Raises:
+        AttributeError: If ``name`` is not a public attribute of the package.
+    """
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,276 @@
+"""
+analytics module for the library system
+
+Defines the CirculationStats class, which keeps running circulation aggregates so reports
+do not have to walk every book and user. Counters and monthly totals are updated on each checkout
+and return, and each checkout counter also maintains its top TOP_N keys, so top-N reports for
+n <= TOP_N read that small set instead of scanning the counter.
+
+Classes:
+    CirculationStats: Running checkout counters per book, author, user and month.
+
+Methods:
+    track_books(books): Rebuilds the per-author book counts from the catalog and clears active loans.
+    record_book_added(book): Counts a book added to the catalog.
+    record_book_removed(book): Stops counting a book removed from the catalog.
+    record_author_changed(book, old_author): Moves a book, and its active loan, to the book's new author.
+    record_checkout(user, book, when): Updates the counters for a checkout.
+    record_return(user, book): Updates the active-loan counters for a return.
+    top_books(n, month): Returns the most borrowed titles, overall or for a month.
+    top_authors(n, month): Returns the most borrowed authors, overall or for a month.
+    top_borrowers(n): Returns the users with the most checkouts.
+    checkouts_in(month): Returns the total number of checkouts in a month.
+    active_borrowers(): Returns the number of users who currently hold a book.
+    author_utilization(): Returns the share of each author's books that is checked out.
+"""
+import heapq
+from collections import Counter
+from datetime import datetime
+from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from .book import Book
+from .user import User
+
+
+def _month_key(when: datetime) -> str:
+    return when.strftime("%Y-%m")
+
+
+def _decrement(counter: Counter, key: Any) -> None:
+    counter[key] -= 1
+    if counter[key] <= 0:
+        del counter[key]
+
+
+def _validated_counts(value: Any) -> Dict[Any, int]:
+    if not isinstance(value, dict):
+        raise ValueError(f"Expected a mapping of counts, got {value!r}")
+    for key, count in value.items():
+        if not isinstance(count, int) or isinstance(count, bool) or count < 0:
+            raise ValueError(f"Invalid count {count!r} for {key!r}")
+    return value
+
+
+TOP_N = 10
+
+
+class _RankedCounter:
+    """
+    Counter that keeps the keys with the TOP_N highest counts up to date.
+
+    Counts only grow, so a key outside the top set can only enter it by passing the current
+    minimum. Each increment therefore costs at most O(TOP_N).
+    """
+    def __init__(self, counts: Optional[Dict[Any, int]] = None) -> None:
+        self.counts = Counter()
+        self._top: set = set()
+        for key, count in (counts or {}).items():
+            self.counts[key] = count
+            self._update_top(key)
+
+    def increment(self, key: Any) -> None:
+        self.counts[key] += 1
+        self._update_top(key)
+
+    def _update_top(self, key: Any) -> None:
+        if key in self._top:
+            return
+        if len(self._top) < TOP_N:
+            self._top.add(key)
+            return
+        lowest = min(self._top, key=self.counts.__getitem__)
+        if self.counts[key] > self.counts[lowest]:
+            self._top.remove(lowest)
+            self._top.add(key)
+
+    def top(self, n: int) -> List[Tuple[Any, int]]:
+        if n > TOP_N:
+            return heapq.nlargest(n, self.counts.items(), key=lambda item: item[1])
+        ranked = sorted(self._top, key=self.counts.__getitem__, reverse=True)
+        return [(key, self.counts[key]) for key in ranked[:n]]
+
+
+class CirculationStats:
+    _book_checkouts: _RankedCounter
+    _author_checkouts: _RankedCounter
+    _user_checkouts: _RankedCounter
+    _monthly_books: Dict[str, _RankedCounter]
+    _monthly_authors: Dict[str, _RankedCounter]
+    _monthly_totals: Counter
+    _active_by_user: Counter
+    _active_by_author: Counter
+    _author_books: Counter
+    _loan_authors: Dict[str, str]
+
+    def __init__(self) -> None:
+        """
+        Initializes empty counters.
+
+        Cumulative and monthly checkout counts are persisted. Active loans and the number of books
+        per author describe the current catalog, which is not persisted with checkout state, so they
+        are rebuilt from the loaded books instead.
+        """
+        self._book_checkouts = _RankedCounter()
+        self._author_checkouts = _RankedCounter()
+        self._user_checkouts = _RankedCounter()
+        self._monthly_books = {}
+        self._monthly_authors = {}
+        self._monthly_totals = Counter()
+        self._active_by_user = Counter()
+        self._active_by_author = Counter()
+        self._author_books = Counter()
+        self._loan_authors = {}
+
+    def track_books(self, books: Iterable[Book]) -> None:
+        """
+        Replaces the per-author book counts with the given catalog and clears active loans.
+
+        Args:
+            books (Iterable[Book]): The books currently in the library.
+        """
+        self._author_books = Counter(book.author for book in books)
+        self._active_by_user.clear()
+        self._active_by_author.clear()
+        self._loan_authors.clear()
+
+    def record_book_added(self, book: Book) -> None:
+        self._author_books[book.author] += 1
+
+    def record_book_removed(self, book: Book) -> None:
+        _decrement(self._author_books, book.author)
+
+    def record_author_changed(self, book: Book, old_author: str) -> None:
+        """
+        Moves a book from old_author to its current author, including its active loan if it is checked out.
+
+        Args:
+            book (Book): The book whose author was changed.
+            old_author (str): The author of the book before the change.
+        """
+        _decrement(self._author_books, old_author)
+        self._author_books[book.author] += 1
+        loan_author = self._loan_authors.get(book.title)
+        if loan_author is not None:
+            _decrement(self._active_by_author, loan_author)
+            self._active_by_author[book.author] += 1
+            self._loan_authors[book.title] = book.author
+
+    def record_checkout(self, user: User, book: Book, when: Optional[datetime] = None) -> None:
+        """
+        Updates the counters for a book checked out by a user.
+
+        Args:
+            user (User): The user who borrowed the book.
+            book (Book): The book that was checked out.
+            when (Optional[datetime]): Time of the checkout. Defaults to now.
+        """
+        month = _month_key(when or datetime.now())
+        self._book_checkouts.increment(book.title)
+        self._author_checkouts.increment(book.author)
+        self._user_checkouts.increment(user.user_id)
+        self._monthly_books.setdefault(month, _RankedCounter()).increment(book.title)
+        self._monthly_authors.setdefault(month, _RankedCounter()).increment(book.author)
+        self._monthly_totals[month] += 1
+        self._active_by_user[user.user_id] += 1
+        self._active_by_author[book.author] += 1
+        self._loan_authors[book.title] = book.author
+
+    def record_return(self, user: User, book: Book) -> None:
+        """
+        Updates the active-loan counters for a book returned by a user.
+
+        Args:
+            user (User): The user who returned the book.
+            book (Book): The book that was returned.
+        """
+        author = self._loan_authors.pop(book.title, book.author)
+        _decrement(self._active_by_user, user.user_id)
+        _decrement(self._active_by_author, author)
+
+    def top_books(self, n: int = 10, month: Optional[str] = None) -> List[Tuple[str, int]]:
+        """
+        Returns the most borrowed titles with their checkout counts.
+
+        Args:
+            n (int): Number of titles to return.
+            month (Optional[str]): Month in "YYYY-MM" format. Defaults to all time.
+        """
+        counter = self._book_checkouts if month is None else self._monthly_books.get(month, _RankedCounter())
+        return counter.top(n)
+
+    def top_authors(self, n: int = 10, month: Optional[str] = None) -> List[Tuple[str, int]]:
+        """
+        Returns the most borrowed authors with their checkout counts.
+
+        Args:
+            n (int): Number of authors to return.
+            month (Optional[str]): Month in "YYYY-MM" format. Defaults to all time.
+        """
+        counter = self._author_checkouts if month is None else self._monthly_authors.get(month, _RankedCounter())
+        return counter.top(n)
+
+    def top_borrowers(self, n: int = 10) -> List[Tuple[int, int]]:
+        """Returns the user IDs with the most checkouts and their checkout counts."""
+        return self._user_checkouts.top(n)
+
+    def checkouts_in(self, month: str) -> int:
+        """Returns the total number of checkouts in a month given in "YYYY-MM" format."""
+        return self._monthly_totals[month]
+
+    def active_borrowers(self) -> int:
+        """Returns the number of users who currently have at least one book checked out."""
+        return len(self._active_by_user)
+
+    def author_utilization(self) -> Dict[str, float]:
+        """Returns, for each author in the catalog, the fraction of their books currently checked out."""
+        return {author: self._active_by_author[author] / count for author, count in self._author_books.items()}
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "books": dict(self._book_checkouts.counts),
+            "authors": dict(self._author_checkouts.counts),
+            "users": {str(user_id): count for user_id, count in self._user_checkouts.counts.items()},
+            "monthly_books": {month: dict(counter.counts) for month, counter in self._monthly_books.items()},
+            "monthly_authors": {month: dict(counter.counts) for month, counter in self._monthly_authors.items()},
+            "monthly_totals": dict(self._monthly_totals),
+        }
+
+    @classmethod
+    def from_dict(cls: "CirculationStats", input_dict: Dict[str, Any]) -> "CirculationStats":
+        """
+        Builds statistics from a dictionary produced by to_dict().
+
+        Raises:
+            ValueError: If the dictionary is malformed or a count is not a non-negative integer.
+        """
+        if not isinstance(input_dict, dict):
+            raise ValueError(f"Expected a mapping of statistics, got {input_dict!r}")
+        users = _validated_counts(input_dict.get("users", {}))
+        monthly_books = input_dict.get("monthly_books", {})
+        monthly_authors = input_dict.get("monthly_authors", {})
+        if not isinstance(monthly_books, dict) or not isinstance(monthly_authors, dict):
+            raise ValueError("Expected monthly statistics to be mappings")
+
+        stats = CirculationStats()
+        stats._book_checkouts = _RankedCounter(_validated_counts(input_dict.get("books", {})))
+        stats._author_checkouts = _RankedCounter(_validated_counts(input_dict.get("authors", {})))
+        stats._user_checkouts = _RankedCounter({int(user_id): count for user_id, count in users.items()})
+        stats._monthly_books = {
+            month: _RankedCounter(_validated_counts(counts)) for month, counts in monthly_books.items()
+        }
+        stats._monthly_authors = {
+            month: _RankedCounter(_validated_counts(counts)) for month, counts in monthly_authors.items()
+        }
+        if "monthly_totals" in input_dict:
+            stats._monthly_totals = Counter(_validated_counts(input_dict["monthly_totals"]))
+        else:
+            # Files saved before monthly totals were tracked.
+            stats._monthly_totals = Counter(
+                {month: sum(counter.counts.values()) for month, counter in stats._monthly_books.items()}
+            )
+        return stats
@@ -1,5 +1,8 @@
+import threading
 from typing import List
+from typing import Optional
 
+from .analytics import CirculationStats
 from .book import Book
 from .exceptions import BookNotAvailableException
 from .exceptions import LibraryException
@@ -9,27 +12,85 @@ from .user import User
 
 
 class Library:
-    def __init__(self):
+    def __init__(self, storage: Optional[LibraryStorage] = None):
         self._books = []
         self._users = []
-        self._storage = LibraryStorage()
+        self._storage = storage or LibraryStorage()
+        self._stats = CirculationStats()
+        self._ready = threading.Event()
+        self._ready.set()
+        self._load_error: Optional[BaseException] = None
+        self._loader: Optional[threading.Thread] = None
+        self._loader_lock = threading.Lock()
+
+    def load_library_data_in_background(self) -> threading.Thread:
+        """
+        Start loading books and users from storage in a daemon thread and return immediately.
+
+        Every operation that reads or modifies the catalog waits for the load to finish,
+        so callers can show a menu or accept requests while the data is still being read.
+        If the load fails, those operations keep raising until load_library_data() succeeds,
+        so a failed load can never be saved over the data files.
+
+        If a background load is already running, its thread is returned instead of starting another.
+        """
+        with self._loader_lock:
+            if not self._ready.is_set():
+                return self._loader
+            self._ready.clear()
+            self._loader = threading.Thread(target=self._load_in_background, name="library-loader", daemon=True)
+            self._loader.start()
+            return self._loader
+
+    def _load_in_background(self):
+        try:
+            self._load_from_storage()
+        except Exception as exc:
+            self._load_error = exc
+        finally:
+            self._ready.set()
+
+    def is_ready(self) -> bool:
+        """Return True once no background load is pending."""
+        return self._ready.is_set()
+
+    def wait_until_ready(self, timeout: Optional[float] = None):
+        """
+        Block until a background load started by load_library_data_in_background() finishes.
+
+        Raises:
+            LibraryException: If the timeout expires or the background load failed.
+        """
+        if not self._ready.wait(timeout):
+            raise LibraryException("Library data is still loading")
+        error = self._load_error
+        if error is not None:
+            raise LibraryException(f"Failed to load library data: {error}") from error
 
     def add_book(self, title: str, author: str):
-        self._books.append(Book(title, author))
+        self.wait_until_ready()
+        book = Book(title, author)
+        self._books.append(book)
+        self._stats.record_book_added(book)
 
     def register_user(self, user_id: int, name: str):
+        self.wait_until_ready()
         self._users.append(User(user_id, name))
 
     def update_book_author(self, title: str, new_author: str):
         """Update the author of a book by its title."""
+        self.wait_until_ready()
         book = next((book for book in self._books if book.title == title), None)
         if not book:
             raise LibraryException(f"Book with title '{title}' was not found")
+        old_author = book.author
         book.author = new_author
+        self._stats.record_author_changed(book, old_author)
         print(f"Updated book: {title}, new author: {new_author}")
 
     def update_user_name(self, user_id: int, new_name: str):
         """Update the name of a user by their ID."""
+        self.wait_until_ready()
         user = next((user for user in self._users if user.user_id == user_id), None)
         if not user:
             raise LibraryException(f"User with ID {user_id} was not found")
@@ -38,22 +99,33 @@ class Library:
 
     def remove_book(self, title: str):
         """Remove a book from the library by its title."""
+        self.wait_until_ready()
         book = next((book for book in self._books if book.title == title), None)
         if not book:
             raise BookNotAvailableException(f"Book with title '{title}' was not found")
+        holder = next((user for user in self._users if book in user.checked_out_books), None)
+        if holder:
+            holder.return_book(book)
+            self._stats.record_return(holder, book)
         self._books.remove(book)
+        self._stats.record_book_removed(book)
         print(f"Removed book: {title}")
 
     def remove_user(self, user_id: int):
         """Remove a user from the library by their ID."""
+        self.wait_until_ready()
         user = next((user for user in self._users if user.user_id == user_id), None)
         if not user:
             raise UserNotRegisteredException(f"User with ID {user_id} was not found")
+        for book in list(user.checked_out_books):
+            user.return_book(book)
+            self._stats.record_return(user, book)
         self._users.remove(user)
         print(f"Removed user ID {user_id}")
 
     def checkout_book(self, user_id: int, book_title: str):
         """Check out a book to a user."""
+        self.wait_until_ready()
         user: User
         book: Book
         user = next((user for user in self._users if user.user_id == user_id), None)
@@ -67,17 +139,51 @@ class Library:
             raise LibraryException(f"User {user.name} has reached the book limit")
 
         user.borrow_book(book)
+        self._stats.record_checkout(user, book)
+
+    def return_book(self, user_id: int, book_title: str):
+        """Return a book checked out by a user."""
+        self.wait_until_ready()
+        user = next((user for user in self._users if user.user_id == user_id), None)
+        if not user:
+            raise UserNotRegisteredException(f"User with ID {user_id} is not registered.")
+        book = next((book for book in user.checked_out_books if book.title == book_title), None)
+        if not book:
+            raise LibraryException(f"User {user.name} has not checked out '{book_title}'")
+
+        user.return_book(book)
+        self._stats.record_return(user, book)
 
     def save_library_data(self):
+        self.wait_until_ready()
         self._storage.save_books(self._books)
         self._storage.save_users(self._users)
+        self._storage.save_stats(self._stats)
 
     def load_library_data(self):
-        self._books = self._storage.load_books()
-        self._users = self._storage.load_users()
+        # Wait for a pending background load, but retry even if it failed.
+        self._ready.wait()
+        self._load_from_storage()
+
+    def _load_from_storage(self):
+        """Load books, users and statistics, replacing the current data only if every file loads."""
+        books = self._storage.load_books()
+        users = self._storage.load_users()
+        stats = self._storage.load_stats()
+        stats.track_books(books)
+        self._books = books
+        self._users = users
+        self._stats = stats
+        self._load_error = None
 
     def get_books(self) -> List[Book]:
+        self.wait_until_ready()
         return self._books
 
     def get_users(self) -> List[User]:
+        self.wait_until_ready()
         return self._users
+
+    def get_stats(self) -> CirculationStats:
+        self.wait_until_ready()
+        return self._stats
@@ -1,16 +1,20 @@
 import json
 import os
+import time
 from typing import List
-from library import Book
-from library import User
+from .analytics import CirculationStats
+from .book import Book
+from .user import User
+
 
 class LibraryStorage:
     """
-    A class to manage storage of books and users in JSON files.
+    A class to manage storage of books, users and circulation statistics in JSON files.
 
     Attributes:
         _book_file (str): Path to the JSON file storing book data.
         _user_file (str): Path to the JSON file storing user data.
+        _stats_file (str): Path to the JSON file storing circulation statistics.
 
     Methods:
         save_books(books: List[Book]) -> None:
@@ -24,21 +28,31 @@ class LibraryStorage:
 
         load_users() -> List[User]:
             Loads users from the user JSON file.
+
+        save_stats(stats: CirculationStats) -> None:
+            Saves circulation statistics to the stats JSON file.
+
+        load_stats() -> CirculationStats:
+            Loads circulation statistics from the stats JSON file.
     """
 
     _book_file: str
     _user_file: str
+    _stats_file: str
 
-    def __init__(self, book_file: str = 'data/books.json', user_file: str = 'data/users.json') -> None:
+    def __init__(self, book_file: str = 'data/books.json', user_file: str = 'data/users.json',
+                 stats_file: str = 'data/stats.json') -> None:
         """
         Initializes the LibraryStorage with file paths.
 
         Args:
             book_file (str): Path to the book JSON file. Default is 'data/books.json'.
             user_file (str): Path to the user JSON file. Default is 'data/users.json'.
+            stats_file (str): Path to the statistics JSON file. Default is 'data/stats.json'.
         """
         self._book_file = book_file
         self._user_file = user_file
+        self._stats_file = stats_file
 
     def save_books(self, books: List[Book]) -> None:
         """
@@ -89,3 +103,38 @@ class LibraryStorage:
                 users_dict_list = json.load(f)
                 users = [User.from_dict(user_dict) for user_dict in users_dict_list]
         return users
+
+    def save_stats(self, stats: CirculationStats) -> None:
+        """
+        Saves circulation statistics to the stats JSON file.
+
+        Args:
+            stats (CirculationStats): The statistics to save.
+        """
+        with open(self._stats_file, 'w') as f:
+            f.write(json.dumps(stats.to_dict(), indent=4))
+
+    def load_stats(self) -> CirculationStats:
+        """
+        Loads circulation statistics from the stats JSON file.
+
+        An invalid file never fails the library load. It is renamed to
+        '<stats_file>.invalid-<timestamp>' so the next save cannot overwrite the checkout history
+        it holds, and empty statistics are returned instead.
+
+        Returns:
+            CirculationStats: The loaded statistics, or empty statistics if the file is missing or invalid.
+        """
+        if os.path.exists(self._stats_file):
+            try:
+                with open(self._stats_file, 'r') as f:
+                    return CirculationStats.from_dict(json.load(f))
+            except (ValueError, KeyError) as e:
+                import logging
+
+                backup_file = f"{self._stats_file}.invalid-{time.strftime('%Y%m%d%H%M%S')}"
+                os.replace(self._stats_file, backup_file)
+                logging.getLogger(__name__).warning(
+                    "Invalid statistics file %s moved to %s: %s", self._stats_file, backup_file, e
+                )
+        return CirculationStats()
@@ -9,17 +9,30 @@ Functions:
     main(): Main function to initialize the library, load data, add books and users, test descriptor validation,
     checkout a book, and save library data.
 
+    main_fast_start(): Show the interactive menu immediately while library data loads in the background.
+    measure_startup(): Print the import time of the library classes, the time to interactive and the time
+    to the first data operation.
+
 Usage:
-    Run this module directly to test library operations.
+    Run this module directly to test library operations. Plain ``python main.py`` keeps the original
+    blocking behaviour: it loads and saves the library data before the interactive menu appears.
+    Pass --fast-start to open the menu without waiting for the catalog to load,
+    or --measure-startup to print startup timings and exit.
 """
 
-from library import Book
+import sys
+import time
+from typing import TYPE_CHECKING
+
+# Only the exceptions module is imported here; the library package resolves the other names lazily,
+# so Library, Book and User (and storage, analytics and json behind them) load when first used.
 from library import BookNotAvailableException
-from library import Library
 from library import LibraryException
-from library import User
 from library import UserNotRegisteredException
 
+if TYPE_CHECKING:
+    from library import Library
+
 
 def print_exception(exception_message: str) -> None:
     control_seq_red = '\033[91m'
@@ -27,7 +40,7 @@ def print_exception(exception_message: str) -> None:
     print(control_seq_red + exception_message + control_seq_end)
 
 
-def interactive_menu(library: Library) -> None:
+def interactive_menu(library: "Library") -> None:
     print("The library system is ready for further operations.")
 
     while True:
@@ -94,6 +107,10 @@ def main():
     This function demonstrates the entire library system workflow, including
     descriptor validation for book titles, authors, and user IDs.
     """
+    from library import Book
+    from library import Library
+    from library import User
+
     library = Library()
 
     # Load existing data
@@ -163,5 +180,52 @@ def main():
     interactive_menu(library)
 
 
+def main_fast_start():
+    """
+    Start loading library data in the background and open the interactive menu right away.
+
+    Menu operations wait for the load only when they touch the catalog. Data is saved on exit.
+    """
+    from library import Library
+
+    library = Library()
+    library.load_library_data_in_background()
+    interactive_menu(library)
+    try:
+        library.save_library_data()
+    except LibraryException as e:
+        print_exception(f"Error: {e}")
+
+
+def measure_startup():
+    """
+    Print startup timings for the --fast-start path, all measured from the same starting point:
+
+    - import time of the Library class (library.library with storage, analytics and json),
+      which the lazy package defers until here;
+    - time to interactive, when the menu could be shown with data still loading;
+    - time until the first operation that needs catalog data completes.
+
+    Interpreter startup and the exceptions module imported at the top of main.py are not included.
+    """
+    started = time.perf_counter()
+    from library import Library
+    imported = time.perf_counter()
+    library = Library()
+    library.load_library_data_in_background()
+    menu_ready = time.perf_counter()
+    books = library.get_books()
+    first_operation = time.perf_counter()
+
+    print(f"Import time: {(imported - started) * 1000:.2f} ms")
+    print(f"Time to interactive: {(menu_ready - started) * 1000:.2f} ms")
+    print(f"Time to first operation: {(first_operation - started) * 1000:.2f} ms ({len(books)} books loaded)")
+
+
 if __name__ == "__main__":
-    main()
+    if "--measure-startup" in sys.argv[1:]:
+        measure_startup()
+    elif "--fast-start" in sys.argv[1:]:
+        main_fast_start()
+    else:
+        main()
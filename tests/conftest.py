@@ -0,0 +1,12 @@
+import pytest
+
+from library import LibraryStorage
+
+
+@pytest.fixture
+def storage(tmp_path):
+    return LibraryStorage(
+        book_file=str(tmp_path / "books.json"),
+        user_file=str(tmp_path / "users.json"),
+        stats_file=str(tmp_path / "stats.json"),
+    )
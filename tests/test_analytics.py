@@ -0,0 +1,138 @@
+import random
+from collections import Counter
+from datetime import datetime
+
+import pytest
+
+from library import Book
+from library import CirculationStats
+from library import Library
+from library import User
+
+
+@pytest.fixture
+def library(storage):
+    library = Library(storage)
+    library.add_book("Advanced Python", "John Doe")
+    library.add_book("Python Programming", "John Doe")
+    library.add_book("Data Science Essentials", "Jane Smith")
+    library.register_user(1, "Maksym")
+    library.register_user(2, "Olha")
+    return library
+
+
+def test_checkout_and_return_update_active_counters(library):
+    library.checkout_book(1, "Advanced Python")
+    library.checkout_book(2, "Data Science Essentials")
+    stats = library.get_stats()
+    assert stats.active_borrowers() == 2
+    assert stats.author_utilization() == {"John Doe": 0.5, "Jane Smith": 1.0}
+
+    library.return_book(1, "Advanced Python")
+    assert stats.active_borrowers() == 1
+    assert stats.author_utilization() == {"John Doe": 0.0, "Jane Smith": 1.0}
+    assert dict(stats.top_books()) == {"Advanced Python": 1, "Data Science Essentials": 1}
+
+
+def test_remove_user_returns_outstanding_loans(library):
+    library.checkout_book(1, "Advanced Python")
+    library.remove_user(1)
+    stats = library.get_stats()
+
+    assert stats.active_borrowers() == 0
+    assert stats.author_utilization()["John Doe"] == 0.0
+
+
+def test_remove_checked_out_book_keeps_utilization_consistent(library):
+    library.checkout_book(1, "Advanced Python")
+    library.remove_book("Advanced Python")
+    library.add_book("Machine Learning Basics", "John Doe")
+    stats = library.get_stats()
+
+    assert library.get_users()[0].checked_out_books == []
+    assert stats.active_borrowers() == 0
+    assert stats.author_utilization()["John Doe"] == 0.0
+
+
+def test_stats_survive_save_and_load(library, storage):
+    library.checkout_book(1, "Advanced Python")
+    library.return_book(1, "Advanced Python")
+    library.checkout_book(2, "Advanced Python")
+    library.save_library_data()
+
+    reloaded = Library(storage)
+    reloaded.load_library_data_in_background().join()
+    stats = reloaded.get_stats()
+    month = datetime.now().strftime("%Y-%m")
+
+    assert stats.top_books() == [("Advanced Python", 2)]
+    assert stats.top_books(month=month) == [("Advanced Python", 2)]
+    assert dict(stats.top_borrowers()) == {1: 1, 2: 1}
+    assert stats.checkouts_in(month) == 2
+    assert stats.to_dict() == library.get_stats().to_dict()
+    assert stats.active_borrowers() == 0
+
+
+def test_invalid_stats_file_does_not_fail_load_or_get_overwritten(library, storage, tmp_path):
+    library.save_library_data()
+    with open(storage._stats_file, "w") as f:
+        f.write('{"books": ')
+
+    reloaded = Library(storage)
+    reloaded.load_library_data()
+    reloaded.save_library_data()
+
+    assert len(reloaded.get_books()) == 3
+    assert reloaded.get_stats().to_dict()["books"] == {}
+    backups = list(tmp_path.glob("stats.json.invalid-*"))
+    assert len(backups) == 1
+    assert backups[0].read_text() == '{"books": '
+
+
+@pytest.mark.parametrize("data", [{"books": {"Advanced Python": "x"}}, {"users": {"1": -1}}, ["books"]])
+def test_invalid_counts_are_rejected(data):
+    with pytest.raises(ValueError):
+        CirculationStats.from_dict(data)
+
+
+def test_update_author_of_checked_out_book_moves_active_loan(library):
+    library.checkout_book(1, "Advanced Python")
+    library.checkout_book(2, "Python Programming")
+    library.update_book_author("Advanced Python", "Emily Johnson")
+    stats = library.get_stats()
+
+    assert stats.author_utilization() == {"John Doe": 1.0, "Emily Johnson": 1.0, "Jane Smith": 0.0}
+
+    library.return_book(1, "Advanced Python")
+    assert stats.author_utilization() == {"John Doe": 1.0, "Emily Johnson": 0.0, "Jane Smith": 0.0}
+
+
+def test_monthly_totals(library):
+    stats = library.get_stats()
+    user = library.get_users()[0]
+    book = library.get_books()[0]
+    stats.record_checkout(user, book, datetime(2026, 9, 1))
+    stats.record_checkout(user, book, datetime(2026, 9, 30))
+    stats.record_checkout(user, book, datetime(2026, 10, 1))
+
+    restored = CirculationStats.from_dict(stats.to_dict())
+    assert restored.checkouts_in("2026-09") == 2
+    assert restored.checkouts_in("2026-10") == 1
+    assert restored.checkouts_in("2026-11") == 0
+
+
+def test_top_n_matches_full_scan():
+    stats = CirculationStats()
+    user = User(1, "Maksym")
+    books = [Book(f"Book {i}", f"Author {i % 7}") for i in range(40)]
+    expected = Counter()
+    rng = random.Random(0)
+    for _ in range(500):
+        book = rng.choice(books)
+        stats.record_checkout(user, book)
+        expected[book.title] += 1
+
+    for n in (1, 5, 10, 20):
+        counts = [count for _, count in stats.top_books(n)]
+        assert counts == sorted(expected.values(), reverse=True)[:n]
+        assert all(expected[title] == count for title, count in stats.top_books(n))
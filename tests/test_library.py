@@ -0,0 +1,82 @@
+import json
+import threading
+
+import pytest
+
+from library import Library
+from library import LibraryException
+
+
+def write_catalog(storage):
+    with open(storage._book_file, "w") as f:
+        json.dump([{"title": "Advanced Python", "author": "John Doe"}], f)
+    with open(storage._user_file, "w") as f:
+        json.dump([{"user_id": 1, "name": "Maksym"}], f)
+
+
+def test_background_load_makes_data_available(storage):
+    write_catalog(storage)
+    library = Library(storage)
+    library.load_library_data_in_background().join()
+
+    assert library.is_ready()
+    assert [book.title for book in library.get_books()] == ["Advanced Python"]
+    assert [user.user_id for user in library.get_users()] == [1]
+
+
+def test_failed_background_load_does_not_overwrite_data(storage):
+    write_catalog(storage)
+    with open(storage._user_file, "w") as f:
+        f.write("[{broken")
+    library = Library(storage)
+    library.load_library_data_in_background().join()
+
+    for _ in range(2):
+        with pytest.raises(LibraryException):
+            library.get_books()
+        with pytest.raises(LibraryException):
+            library.add_book("Data Science Essentials", "Jane Smith")
+        with pytest.raises(LibraryException):
+            library.save_library_data()
+
+    with open(storage._book_file) as f:
+        assert json.load(f) == [{"title": "Advanced Python", "author": "John Doe"}]
+    with open(storage._user_file) as f:
+        assert f.read() == "[{broken"
+
+
+def test_load_library_data_retries_after_failed_background_load(storage):
+    with open(storage._book_file, "w") as f:
+        f.write("not json")
+    library = Library(storage)
+    library.load_library_data_in_background().join()
+
+    write_catalog(storage)
+    library.load_library_data()
+
+    assert [book.title for book in library.get_books()] == ["Advanced Python"]
+    library.save_library_data()
+
+
+def test_background_load_is_not_restarted_while_running(storage):
+    write_catalog(storage)
+    release = threading.Event()
+    load_books = storage.load_books
+    calls = []
+
+    def blocking_load_books():
+        calls.append(1)
+        release.wait()
+        return load_books()
+
+    storage.load_books = blocking_load_books
+    library = Library(storage)
+    first = library.load_library_data_in_background()
+    second = library.load_library_data_in_background()
+    assert first is second
+    assert not library.is_ready()
+
+    release.set()
+    first.join()
+    assert len(calls) == 1
+    assert [book.title for book in library.get_books()] == ["Advanced Python"]